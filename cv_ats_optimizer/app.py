@@ -7,40 +7,44 @@ from typing import Optional
 import streamlit as st
 
 from cv_ats_optimizer.config.settings import settings
-from cv_ats_optimizer.parsers.jd_parser import JDStructured, extract_jd_sections
-from cv_ats_optimizer.utils.file_parser import FileParsingError, parse_file
-from cv_ats_optimizer.utils.text_processor import clean_text, count_words
-from cv_ats_optimizer.utils.validators import InputValidator
+from cv_ats_optimizer.parsers.jd_parser import JDStructured
+from cv_ats_optimizer.utils.ingest import (
+    parse_stored_jd,
+    read_upload,
+    store_cv,
+    store_job_description,
+)
+from cv_ats_optimizer.utils.text_processor import clean_text, count_words, warm_normalizer
+from cv_ats_optimizer.utils.text_store import TextHandle
 
 st.set_page_config(page_title=settings.app_title, page_icon="📄", layout="wide")
 
-if "cv_text" not in st.session_state:
-    st.session_state.cv_text = ""
-if "jd_text" not in st.session_state:
-    st.session_state.jd_text = ""
-if "jd_structured" not in st.session_state:
-    st.session_state.jd_structured = None
+# Sessions hold handles into the shared text store rather than their own copies,
+# so many sessions viewing the same document share one copy in memory.
+if "cv_handle" not in st.session_state:
+    st.session_state.cv_handle = None
+if "jd_handle" not in st.session_state:
+    st.session_state.jd_handle = None
+if "jd_structured_handle" not in st.session_state:
+    st.session_state.jd_structured_handle = None
 
-validator = InputValidator()
+# Load NLTK at startup rather than inside the first analysis request.
+warm_normalizer()
+
+
+def _session_value(name: str):
+    handle: Optional[TextHandle] = st.session_state[name]
+    return handle.get() if handle is not None else None
 
 
 def _handle_file_upload(file, label: str) -> Optional[str]:
     if not file:
         return None
-    extension_result = validator.validate_file_extension(file.name)
-    if not extension_result.is_valid:
-        st.error(extension_result.message)
-        return None
-    size_result = validator.validate_file_size(file.size)
-    if not size_result.is_valid:
-        st.error(size_result.message)
-        return None
-    try:
-        content = parse_file(file.name, file.read())
-    except FileParsingError as exc:
-        st.error(f"Failed to parse {label}: {exc}")
+    result = read_upload(file.name, file.read(), label)
+    if not result.ok:
+        st.error(result.message)
         return None
-    return content
+    return result.text
 
 
 def _display_text_preview(text: str, label: str) -> None:
@@ -62,13 +66,13 @@ with col_upload:
     if uploaded_cv is not None:
         content = _handle_file_upload(uploaded_cv, "CV file")
         if content:
-            result = validator.validate_cv(content)
-            if result.is_valid:
-                st.session_state.cv_text = content
+            result = store_cv(content)
+            if result.ok:
+                st.session_state.cv_handle = result.handle
                 st.success("CV uploaded and validated.")
             else:
                 st.error(result.message)
-    _display_text_preview(st.session_state.cv_text, "CV")
+    _display_text_preview(_session_value("cv_handle") or "", "CV")
 
 with col_paste:
     st.markdown("**Paste CV Text**")
@@ -78,15 +82,16 @@ with col_paste:
             st.error("Please paste your CV text before submitting.")
         else:
             cleaned = clean_text(pasted_cv)
-            result = validator.validate_cv(cleaned)
-            if result.is_valid:
-                st.session_state.cv_text = cleaned
+            result = store_cv(cleaned)
+            if result.ok:
+                st.session_state.cv_handle = result.handle
                 st.success("Pasted CV saved.")
             else:
                 st.error(result.message)
 
-if st.session_state.cv_text:
-    st.info(f"CV ready with {count_words(st.session_state.cv_text)} words.")
+cv_text = _session_value("cv_handle") or ""
+if cv_text:
+    st.info(f"CV ready with {count_words(cv_text)} words.")
 
 st.divider()
 
@@ -100,9 +105,9 @@ if input_mode == "Paste Text":
             st.error("Please paste the job description before submitting.")
         else:
             cleaned = clean_text(pasted_jd)
-            result = validator.validate_job_description(cleaned)
-            if result.is_valid:
-                st.session_state.jd_text = cleaned
+            result = store_job_description(cleaned)
+            if result.ok:
+                st.session_state.jd_handle = result.handle
                 st.success("Job description saved.")
             else:
                 st.error(result.message)
@@ -111,33 +116,33 @@ else:
     if uploaded_jd is not None:
         content = _handle_file_upload(uploaded_jd, "job description")
         if content:
-            result = validator.validate_job_description(content)
-            if result.is_valid:
-                st.session_state.jd_text = content
+            result = store_job_description(content)
+            if result.ok:
+                st.session_state.jd_handle = result.handle
                 st.success("Job description uploaded and validated.")
             else:
                 st.error(result.message)
 
-_display_text_preview(st.session_state.jd_text, "Job Description")
+jd_text = _session_value("jd_handle") or ""
+_display_text_preview(jd_text, "Job Description")
 
-if st.session_state.jd_text:
-    st.info(f"Job description ready with {count_words(st.session_state.jd_text)} words.")
+if jd_text:
+    st.info(f"Job description ready with {count_words(jd_text)} words.")
 
 st.divider()
 
 st.subheader("Analysis")
 if st.button("Analyze JD & CV (Phase-1)"):
-    if not st.session_state.cv_text:
+    if not cv_text:
         st.error("Please provide a CV before analysis.")
-    elif not st.session_state.jd_text:
+    elif not jd_text:
         st.error("Please provide a job description before analysis.")
     else:
         with st.spinner("Parsing job description..."):
-            structured = extract_jd_sections(st.session_state.jd_text)
-            st.session_state.jd_structured = structured
+            st.session_state.jd_structured_handle = parse_stored_jd(st.session_state.jd_handle)
         st.success("Job description parsed successfully.")
 
-structured: Optional[JDStructured] = st.session_state.jd_structured
+structured: Optional[JDStructured] = _session_value("jd_structured_handle")
 if structured:
     st.header("Parsed Job Description")
     top_cols = st.columns(5)
@@ -0,0 +1,88 @@
+"""Benchmark the memoized token normalization against calling NLTK per token.
+
+Tokens are drawn from a Zipf distribution over a synthetic vocabulary of
+inflected words, which is roughly how words are distributed in CVs and JDs.
+
+Example::
+
+    python -m cv_ats_optimizer.benchmarks.bench_normalization --tokens 500000 --vocab 20000
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import string
+import time
+
+from cv_ats_optimizer.utils.text_processor import (
+    clear_normalization_cache,
+    get_stemmer,
+    normalization_cache_info,
+    normalize_token,
+    normalize_tokens,
+)
+
+_SUFFIXES = ["", "s", "ed", "ing", "er", "ers", "ment", "ments", "ly"]
+
+
+def zipf_tokens(count: int, vocab_size: int, exponent: float = 1.1, seed: int = 0) -> list[str]:
+    """Return ``count`` tokens sampled with Zipfian frequencies."""
+
+    rng = random.Random(seed)
+    vocab: list[str] = []
+    while len(vocab) < vocab_size:
+        root = "".join(rng.choices(string.ascii_lowercase, k=rng.randint(4, 9)))
+        vocab.extend(root + suffix for suffix in _SUFFIXES)
+    vocab = vocab[:vocab_size]
+    rng.shuffle(vocab)
+    weights = [1 / rank**exponent for rank in range(1, vocab_size + 1)]
+    return rng.choices(vocab, weights=weights, k=count)
+
+
+def _time(func) -> float:
+    started = time.perf_counter()
+    func()
+    return time.perf_counter() - started
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tokens", type=int, default=200_000)
+    parser.add_argument("--vocab", type=int, default=10_000)
+    parser.add_argument("--zipf", type=float, default=1.1, help="Zipf exponent")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    tokens = zipf_tokens(args.tokens, args.vocab, args.zipf, args.seed)
+    stemmer = get_stemmer()
+
+    uncached = _time(lambda: [stemmer.stem(token) for token in tokens])
+
+    clear_normalization_cache()
+    per_token = _time(lambda: [normalize_token(token) for token in tokens])
+    info = normalization_cache_info()
+    per_token_warm = _time(lambda: [normalize_token(token) for token in tokens])
+
+    clear_normalization_cache()
+    batched = _time(lambda: normalize_tokens(tokens))
+    batched_warm = _time(lambda: normalize_tokens(tokens))
+
+    hit_rate = info.hits / (info.hits + info.misses)
+    print(f"tokens={len(tokens)} distinct={len(set(tokens))} zipf={args.zipf}")
+    print(f"cache hit rate={hit_rate:.1%} (size={info.currsize}, max={info.maxsize})")
+    for label, seconds in (
+        ("nltk per token", uncached),
+        ("normalize_token", per_token),
+        ("normalize_token, warm", per_token_warm),
+        ("normalize_tokens", batched),
+        ("normalize_tokens, warm", batched_warm),
+    ):
+        print(
+            f"{label:<24}{seconds * 1000:>10.1f} ms{len(tokens) / seconds:>14,.0f} tokens/s"
+            f"{uncached / seconds:>8.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
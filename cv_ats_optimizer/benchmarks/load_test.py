@@ -0,0 +1,558 @@
+"""Concurrent-session load test for the app's upload and analysis path.
+
+Each simulated session runs the same ``utils.ingest`` calls as ``app.py``:
+upload, validate and store a CV, then a job description, then parse the JD
+through the shared text store. Sessions arrive as a Poisson process and run
+on a thread or process pool.
+
+Each run gets its own text store, so the JD parse is memoized only within a
+run. With few ``--distinct`` documents most sessions hit that memo and the
+``extract_jd_sections`` stage times a lookup; the report's memo hit rate says
+how often, and ``--direct-parse`` times the parser on every session instead.
+
+Example::
+
+    python -m cv_ats_optimizer.benchmarks.load_test --sessions 200 --rate 50 --workers 16
+"""
+
+from __future__ import annotations
+
+import argparse
+from collections import deque
+from concurrent.futures import (
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    as_completed,
+)
+from dataclasses import asdict, dataclass, field
+import io
+import json
+import os
+from pathlib import Path
+import random
+import sys
+import threading
+import time
+
+import docx
+
+from cv_ats_optimizer.config.constants import ALLOWED_EXTENSIONS
+from cv_ats_optimizer.config.settings import settings
+from cv_ats_optimizer.parsers.jd_parser import extract_jd_sections
+from cv_ats_optimizer.utils.ingest import (
+    parse_stored_jd,
+    read_upload,
+    store_cv,
+    store_job_description,
+)
+from cv_ats_optimizer.utils.stats import percentile
+from cv_ats_optimizer.utils.text_processor import warm_normalizer
+from cv_ats_optimizer.utils.text_store import SharedTextStore, TextHandle
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+# Named after the app steps; the validate stages include the text store put and
+# extract_jd_sections goes through the store's per-JD memoization unless the
+# run uses direct_parse.
+STAGES = (
+    "handle_file_upload",
+    "validate_cv",
+    "validate_job_description",
+    "extract_jd_sections",
+)
+
+_SKILLS = [
+    "Python", "SQL", "AWS", "Docker", "Kubernetes", "React", "TypeScript", "Spark",
+    "Airflow", "PostgreSQL", "Terraform", "GraphQL", "Kafka", "Redis", "Django", "FastAPI",
+]
+_VERBS = ["Built", "Designed", "Led", "Shipped", "Optimized", "Automated", "Delivered", "Improved"]
+_OBJECTS = [
+    "data pipelines", "REST APIs", "payment services", "internal tooling", "CI/CD workflows",
+    "analytics dashboards", "search infrastructure", "customer onboarding flows",
+]
+
+_PAGE_KB = os.sysconf("SC_PAGE_SIZE") // 1024 if hasattr(os, "sysconf") else 0
+
+# Per-worker state set up by _init_worker. In thread mode every worker thread
+# shares the run's store; in process mode each worker process has its own.
+_worker_store: SharedTextStore | None = None
+# Handles of finished sessions kept open until their expiry time.
+_open_sessions: deque[tuple[float, list[TextHandle]]] = deque()
+_open_sessions_lock = threading.Lock()
+
+
+Document = tuple[str, bytes]
+
+
+@dataclass
+class StageSample:
+    stage: str
+    wall: float
+    cpu: float
+    rss_delta_kb: int
+    peak_rss_kb: int
+    ok: bool
+
+
+@dataclass
+class SessionResult:
+    samples: list[StageSample] = field(default_factory=list)
+    ok: bool = True
+    jd_parsed: bool = False
+
+
+@dataclass
+class StageReport:
+    stage: str
+    count: int
+    errors: int
+    p50_ms: float
+    p95_ms: float
+    p99_ms: float
+    mean_cpu_ms: float
+    mean_rss_delta_kb: float
+    max_rss_delta_kb: int
+
+
+@dataclass
+class LoadTestReport:
+    mode: str
+    workers: int
+    sessions: int
+    distinct: int
+    hold_s: float
+    direct_parse: bool
+    failed_sessions: int
+    duration_s: float
+    throughput_per_s: float
+    session_p50_ms: float
+    session_p95_ms: float
+    session_p99_ms: float
+    peak_rss_mb: float
+    jd_memo_hit_rate: float
+    stages: list[StageReport]
+
+
+def _peak_rss_kb() -> int:
+    if resource is None:
+        return 0
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is bytes on macOS and kilobytes elsewhere.
+    return peak // 1024 if sys.platform == "darwin" else peak
+
+
+def _current_rss_kb() -> int:
+    try:
+        with open("/proc/self/statm") as statm:
+            return int(statm.read().split()[1]) * _PAGE_KB
+    except (OSError, ValueError, IndexError):
+        return 0
+
+
+def _timed(result: SessionResult, stage: str, func, *args):
+    rss_start = _current_rss_kb()
+    wall_start = time.perf_counter()
+    cpu_start = time.thread_time()
+    value = func(*args)
+    wall = time.perf_counter() - wall_start
+    cpu = time.thread_time() - cpu_start
+    ok = getattr(value, "ok", True)
+    result.samples.append(
+        StageSample(stage, wall, cpu, _current_rss_kb() - rss_start, _peak_rss_kb(), ok)
+    )
+    if not ok:
+        result.ok = False
+    return value
+
+
+def _hold(handles: list[TextHandle], hold: float) -> None:
+    """Keep a finished session's handles alive for ``hold`` seconds, like an open tab."""
+
+    now = time.perf_counter()
+    with _open_sessions_lock:
+        while _open_sessions and _open_sessions[0][0] <= now:
+            _open_sessions.popleft()
+        if hold > 0 and handles:
+            _open_sessions.append((now + hold, handles))
+
+
+def run_session(
+    cv: Document,
+    jd: Document,
+    store: SharedTextStore | None = None,
+    hold: float = 0.0,
+    direct_parse: bool = False,
+) -> SessionResult:
+    """Run one session through the same ingest calls ``app.py`` makes.
+
+    ``store`` defaults to the worker's store. With ``direct_parse`` the JD is
+    parsed on every session instead of through the store's memo.
+    """
+
+    store = store if store is not None else _worker_store
+    result = SessionResult()
+    handles: list[TextHandle] = []
+
+    def parse(text: str):
+        result.jd_parsed = True
+        return extract_jd_sections(text)
+
+    try:
+        upload = _timed(result, "handle_file_upload", read_upload, *cv, "CV file")
+        if not upload.ok:
+            return result
+        cv_result = _timed(result, "validate_cv", store_cv, upload.text, store)
+        if not cv_result.ok:
+            return result
+        handles.append(cv_result.handle)
+        upload = _timed(result, "handle_file_upload", read_upload, *jd, "job description")
+        if not upload.ok:
+            return result
+        jd_result = _timed(
+            result, "validate_job_description", store_job_description, upload.text, store
+        )
+        if not jd_result.ok:
+            return result
+        handles.append(jd_result.handle)
+        if direct_parse:
+            _timed(result, "extract_jd_sections", parse, jd_result.text)
+        else:
+            handles.append(
+                _timed(result, "extract_jd_sections", parse_stored_jd, jd_result.handle, store, parse)
+            )
+        return result
+    finally:
+        _hold(handles, hold)
+
+
+def _init_worker(
+    store: SharedTextStore | None, max_bytes: int, cv: Document, jd: Document
+) -> None:
+    """Set up the worker's store and pay one-time costs, such as the NLTK import."""
+
+    global _worker_store
+    _worker_store = store if store is not None else SharedTextStore(max_bytes)
+    warm_normalizer()
+    run_session(cv, jd)
+
+
+def _settle(_: int) -> None:
+    # Holds a worker briefly so every worker is started and initialized
+    # before the first measured session is submitted.
+    time.sleep(0.05)
+
+
+def _synthetic_cv(rng: random.Random) -> str:
+    lines = ["Jane Doe", "jane.doe@example.com | +1 555 123 4567", "", "Summary"]
+    lines.append("Engineer with experience across backend and data platforms.")
+    lines += ["", "Experience"]
+    for _ in range(rng.randint(8, 30)):
+        lines.append(
+            f"- {rng.choice(_VERBS)} {rng.choice(_OBJECTS)} using "
+            f"{rng.choice(_SKILLS)} and {rng.choice(_SKILLS)}, serving {rng.randint(2, 900)}k users"
+        )
+    lines += ["", "Skills", ", ".join(rng.sample(_SKILLS, 8))]
+    lines += ["", "Education", "BSc Computer Science"]
+    return "\n".join(lines)
+
+
+def _synthetic_jd(rng: random.Random) -> str:
+    skills = rng.sample(_SKILLS, 10)
+    lines = [
+        f"Job Title: Senior {rng.choice(['Backend', 'Data', 'Platform'])} Engineer",
+        "Company: Tech Innovators Inc.",
+        f"Location: {rng.choice(['Remote', 'Berlin', 'Bangalore', 'New York'])}",
+        "Employment Type: Full-time",
+        "",
+        "We are looking for an engineer with strong ownership and communication skills.",
+        "",
+        "About Us",
+        "Tech Innovators builds scalable platforms for hiring teams.",
+        "",
+        "Responsibilities",
+    ]
+    for _ in range(rng.randint(4, 15)):
+        lines.append(f"- {rng.choice(_VERBS)} {rng.choice(_OBJECTS)}")
+    lines += ["", "Requirements", f"- {', '.join(skills[:5])}"]
+    lines.append(f"- {rng.randint(2, 8)}+ years experience building production systems")
+    lines += ["", "Preferred Skills", f"- {', '.join(skills[5:])}"]
+    lines += ["", "Bachelor's degree in Computer Science or equivalent", ""]
+    lines.append("We are an equal opportunity employer and value diversity.")
+    lines.append("Contact: hiring@techinnovators.com")
+    return "\n".join(lines)
+
+
+def _encode(text: str, extension: str) -> bytes:
+    if extension == ".txt":
+        return text.encode("utf-8")
+    if extension == ".docx":
+        document = docx.Document()
+        for block in text.split("\n"):
+            document.add_paragraph(block)
+        buffer = io.BytesIO()
+        document.save(buffer)
+        return buffer.getvalue()
+    raise ValueError(f"Cannot synthesize {extension} documents; pass them via --samples.")
+
+
+def build_corpus(
+    mix: dict[str, float],
+    distinct: int = 20,
+    samples_dir: Path | None = None,
+    seed: int = 0,
+) -> dict[str, dict[str, list[Document]]]:
+    """Return ``{"cv"|"jd": {extension: [(filename, bytes), ...]}}`` for the mix.
+
+    ``distinct`` TXT and DOCX documents of each kind are synthesized per
+    extension. Files in ``samples_dir`` whose names
+    start with ``cv`` or ``jd`` are added to the pool for their extension, which
+    is the only way to include PDFs.
+    """
+
+    rng = random.Random(seed)
+    corpus: dict[str, dict[str, list[Document]]] = {"cv": {}, "jd": {}}
+    for extension in mix:
+        if extension not in ALLOWED_EXTENSIONS:
+            raise ValueError(f"Unsupported extension in mix: {extension}.")
+        if extension == ".pdf":
+            continue
+        for kind, make in (("cv", _synthetic_cv), ("jd", _synthetic_jd)):
+            corpus[kind][extension] = [
+                (f"{kind}_{i}{extension}", _encode(make(rng), extension)) for i in range(distinct)
+            ]
+    if samples_dir is not None:
+        for path in sorted(Path(samples_dir).iterdir()):
+            kind = path.name[:2].lower()
+            extension = path.suffix.lower()
+            if kind in corpus and extension in mix:
+                corpus[kind].setdefault(extension, []).append((path.name, path.read_bytes()))
+    for kind, pools in corpus.items():
+        missing = [extension for extension in mix if not pools.get(extension)]
+        if missing:
+            raise ValueError(f"No {kind.upper()} documents for: {', '.join(missing)}.")
+    return corpus
+
+
+def _pick(rng: random.Random, pools: dict[str, list[Document]], mix: dict[str, float]) -> Document:
+    extension = rng.choices(list(mix), weights=list(mix.values()))[0]
+    return rng.choice(pools[extension])
+
+
+def _summarize(
+    mode: str,
+    workers: int,
+    results: list[SessionResult],
+    session_latencies: list[float],
+    duration: float,
+    distinct: int,
+    hold: float,
+    direct_parse: bool,
+) -> LoadTestReport:
+    stages = []
+    for stage in STAGES:
+        samples = [sample for result in results for sample in result.samples if sample.stage == stage]
+        walls = [sample.wall for sample in samples]
+        stages.append(
+            StageReport(
+                stage=stage,
+                count=len(samples),
+                errors=sum(not sample.ok for sample in samples),
+                p50_ms=percentile(walls, 50) * 1000,
+                p95_ms=percentile(walls, 95) * 1000,
+                p99_ms=percentile(walls, 99) * 1000,
+                mean_cpu_ms=(sum(sample.cpu for sample in samples) / len(samples) * 1000) if samples else 0.0,
+                mean_rss_delta_kb=(
+                    sum(sample.rss_delta_kb for sample in samples) / len(samples) if samples else 0.0
+                ),
+                max_rss_delta_kb=max((sample.rss_delta_kb for sample in samples), default=0),
+            )
+        )
+    # Sessions that reached the JD stage; a memo hit is one that did not run the parser.
+    parses = [
+        result.jd_parsed
+        for result in results
+        if any(sample.stage == "extract_jd_sections" for sample in result.samples)
+    ]
+    return LoadTestReport(
+        mode=mode,
+        workers=workers,
+        sessions=len(results),
+        distinct=distinct,
+        hold_s=hold,
+        direct_parse=direct_parse,
+        failed_sessions=sum(not result.ok for result in results),
+        duration_s=duration,
+        throughput_per_s=len(results) / duration if duration else 0.0,
+        session_p50_ms=percentile(session_latencies, 50) * 1000,
+        session_p95_ms=percentile(session_latencies, 95) * 1000,
+        session_p99_ms=percentile(session_latencies, 99) * 1000,
+        peak_rss_mb=max(
+            (sample.peak_rss_kb for result in results for sample in result.samples), default=0
+        ) / 1024,
+        jd_memo_hit_rate=(1 - sum(parses) / len(parses)) if parses else 0.0,
+        stages=stages,
+    )
+
+
+def run_load_test(
+    sessions: int = 50,
+    rate: float = 0.0,
+    mode: str = "thread",
+    workers: int = 8,
+    mix: dict[str, float] | None = None,
+    samples_dir: Path | None = None,
+    seed: int = 0,
+    distinct: int = 20,
+    hold: float = 0.0,
+    direct_parse: bool = False,
+) -> LoadTestReport:
+    """Drive ``sessions`` simulated sessions and report per-stage statistics.
+
+    ``rate`` is the mean arrival rate in sessions per second; ``0`` submits all
+    sessions at once. Session latency is measured from arrival, so it includes
+    time spent queued for a worker and rises sharply past saturation.
+
+    ``distinct`` sets how many different CVs and JDs exist per extension. The
+    run uses a fresh text store, so earlier runs in the same process do not
+    warm its memo. ``hold`` keeps each finished session's handles alive for
+    that many seconds, so the store and peak RSS reflect open sessions.
+
+    Each worker first runs one unmeasured session on documents outside the
+    plan. Stage RSS is the change in the worker's resident set across the
+    stage; in thread mode concurrent stages share the process, so treat it as
+    indicative. The report's peak RSS is the largest worker high-water mark.
+    """
+
+    mix = mix or {".txt": 0.6, ".docx": 0.4}
+    corpus = build_corpus(mix, distinct=distinct, samples_dir=samples_dir, seed=seed)
+    rng = random.Random(seed)
+    plan = [(_pick(rng, corpus["cv"], mix), _pick(rng, corpus["jd"], mix)) for _ in range(sessions)]
+
+    executor_cls: type[Executor]
+    max_bytes = settings.text_store_max_mb * 1024 * 1024
+    if mode == "thread":
+        executor_cls = ThreadPoolExecutor
+        store: SharedTextStore | None = SharedTextStore(max_bytes)
+    elif mode == "process":
+        executor_cls = ProcessPoolExecutor
+        store = None  # Each worker process builds its own.
+    else:
+        raise ValueError(f"Unknown mode: {mode}.")
+
+    warm_rng = random.Random(seed - 1)
+    warm_documents = (
+        ("warmup_cv.txt", _encode(_synthetic_cv(warm_rng), ".txt")),
+        ("warmup_jd.txt", _encode(_synthetic_jd(warm_rng), ".txt")),
+    )
+    with executor_cls(
+        max_workers=workers, initializer=_init_worker, initargs=(store, max_bytes, *warm_documents)
+    ) as executor:
+        list(executor.map(_settle, range(workers)))
+        arrivals: list[float] = []
+        futures: dict[Future[SessionResult], int] = {}
+        started = time.perf_counter()
+        next_arrival = started
+        for index, (cv, jd) in enumerate(plan):
+            if rate > 0:
+                next_arrival += rng.expovariate(rate)
+                delay = next_arrival - time.perf_counter()
+                if delay > 0:
+                    time.sleep(delay)
+            arrivals.append(time.perf_counter())
+            futures[executor.submit(run_session, cv, jd, store, hold, direct_parse)] = index
+        completions = [0.0] * sessions
+        for future in as_completed(futures):
+            completions[futures[future]] = time.perf_counter()
+        finished = time.perf_counter()
+        results = [future.result() for future in futures]
+    with _open_sessions_lock:
+        _open_sessions.clear()
+    session_latencies = [done - arrived for arrived, done in zip(arrivals, completions)]
+    return _summarize(
+        mode,
+        workers,
+        results,
+        session_latencies,
+        finished - started,
+        distinct,
+        hold,
+        direct_parse,
+    )
+
+
+def format_report(report: LoadTestReport) -> str:
+    lines = [
+        f"mode={report.mode} workers={report.workers} sessions={report.sessions} "
+        f"distinct={report.distinct} hold={report.hold_s:g}s direct_parse={report.direct_parse} "
+        f"failed={report.failed_sessions} duration={report.duration_s:.2f}s "
+        f"throughput={report.throughput_per_s:.1f} sessions/s",
+        f"session latency p50={report.session_p50_ms:.1f}ms p95={report.session_p95_ms:.1f}ms "
+        f"p99={report.session_p99_ms:.1f}ms peak rss={report.peak_rss_mb:.1f}MB "
+        f"jd memo hit rate={report.jd_memo_hit_rate:.1%}",
+        "",
+        f"{'stage':<26}{'count':>7}{'errors':>8}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}"
+        f"{'cpu ms':>10}{'rss+ KB':>10}{'max rss+':>10}",
+    ]
+    for stage in report.stages:
+        lines.append(
+            f"{stage.stage:<26}{stage.count:>7}{stage.errors:>8}{stage.p50_ms:>10.2f}"
+            f"{stage.p95_ms:>10.2f}{stage.p99_ms:>10.2f}{stage.mean_cpu_ms:>10.2f}"
+            f"{stage.mean_rss_delta_kb:>10.1f}{stage.max_rss_delta_kb:>10}"
+        )
+    return "\n".join(lines)
+
+
+def _parse_mix(value: str) -> dict[str, float]:
+    mix = {}
+    for part in value.split(","):
+        extension, _, weight = part.partition("=")
+        extension = extension.strip().lower()
+        if not extension.startswith("."):
+            extension = f".{extension}"
+        mix[extension] = float(weight or 1)
+    return mix
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sessions", type=int, default=50)
+    parser.add_argument("--rate", type=float, default=0.0, help="sessions per second; 0 = burst")
+    parser.add_argument("--mode", choices=["thread", "process"], default="thread")
+    parser.add_argument("--workers", type=int, default=8)
+    parser.add_argument("--mix", type=_parse_mix, default=None, help="e.g. txt=3,docx=1,pdf=1")
+    parser.add_argument("--samples", type=Path, default=None, help="directory of cv*/jd* files")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--distinct", type=int, default=20, help="distinct CVs and JDs per extension"
+    )
+    parser.add_argument(
+        "--hold", type=float, default=0.0, help="seconds each session keeps its documents open"
+    )
+    parser.add_argument(
+        "--direct-parse", action="store_true", help="parse every JD instead of using the memo"
+    )
+    parser.add_argument("--json", action="store_true", help="print the report as JSON")
+    args = parser.parse_args(argv)
+
+    report = run_load_test(
+        sessions=args.sessions,
+        rate=args.rate,
+        mode=args.mode,
+        workers=args.workers,
+        mix=args.mix,
+        samples_dir=args.samples,
+        seed=args.seed,
+        distinct=args.distinct,
+        hold=args.hold,
+        direct_parse=args.direct_parse,
+    )
+    print(json.dumps(asdict(report), indent=2) if args.json else format_report(report))
+
+
+if __name__ == "__main__":
+    main()
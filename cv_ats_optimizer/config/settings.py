@@ -25,7 +25,23 @@ class Settings:
 
     app_title: str = os.getenv("APP_TITLE", "ATS CV Optimizer")
     gemini_api_key: str | None = os.getenv("GEMINI_API_KEY")
+    gemini_model: str = os.getenv("GEMINI_MODEL", "gemini-1.5-flash")
+    gemini_base_url: str = os.getenv(
+        "GEMINI_BASE_URL", "https://generativelanguage.googleapis.com/v1beta"
+    )
+    gemini_timeout_seconds: float = float(os.getenv("GEMINI_TIMEOUT_SECONDS", "30"))
+    gemini_max_concurrency: int = int(os.getenv("GEMINI_MAX_CONCURRENCY", "4"))
+    gemini_requests_per_minute: int = int(os.getenv("GEMINI_REQUESTS_PER_MINUTE", "60"))
+    gemini_max_retries: int = int(os.getenv("GEMINI_MAX_RETRIES", "3"))
+    gemini_cache_ttl_seconds: int = int(os.getenv("GEMINI_CACHE_TTL_SECONDS", "86400"))
+    gemini_cache_max_entries: int = int(os.getenv("GEMINI_CACHE_MAX_ENTRIES", "1024"))
     max_file_size_mb: int = int(os.getenv("MAX_FILE_SIZE_MB", "5"))
+    text_store_max_mb: int = int(os.getenv("TEXT_STORE_MAX_MB", "256"))
+    parse_executor: str = os.getenv("PARSE_EXECUTOR", "process")
+    parse_timeout_seconds: float = float(os.getenv("PARSE_TIMEOUT_SECONDS", "30"))
+    parse_max_concurrency: int = int(os.getenv("PARSE_MAX_CONCURRENCY", "4"))
+    database_path: str = os.getenv("DATABASE_PATH", str(PROJECT_ROOT / "data" / "documents.db"))
+    normalization_cache_size: int = int(os.getenv("NORMALIZATION_CACHE_SIZE", "50000"))
     enforce_unique_words: bool = _get_bool(os.getenv("ENFORCE_UNIQUE_WORDS"), True)
     enforce_stopword_ban: bool = _get_bool(os.getenv("ENFORCE_STOPWORD_BAN"), False)
     enforce_banned_terms: bool = _get_bool(os.getenv("ENFORCE_BANNED_TERMS"), True)
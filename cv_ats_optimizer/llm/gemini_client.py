@@ -0,0 +1,355 @@
+"""Async Gemini client with response caching, request coalescing and rate limiting."""
+
+from __future__ import annotations
+
+import asyncio
+from collections import OrderedDict, deque
+from dataclasses import dataclass, field
+import hashlib
+import http.client
+import json
+import random
+import threading
+import time
+from typing import Any, Callable, Iterable
+import urllib.error
+import urllib.request
+
+from cv_ats_optimizer.config.settings import settings
+from cv_ats_optimizer.utils.stats import percentile
+
+RETRYABLE_STATUS_CODES = {408, 429, 500, 502, 503, 504}
+MAX_BACKOFF_SECONDS = 20.0
+LATENCY_SAMPLE_SIZE = 10_000
+
+
+class GeminiError(RuntimeError):
+    """Raised when the Gemini API cannot produce a response."""
+
+
+class _RetryableError(GeminiError):
+    def __init__(self, message: str, retry_after: float | None = None) -> None:
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+def cache_key(model: str, prompt: str, generation_config: dict[str, Any] | None = None) -> str:
+    """Return a content hash identifying a prompt for a given model and config."""
+
+    payload = json.dumps(
+        {"model": model, "prompt": prompt, "config": generation_config or {}},
+        sort_keys=True,
+        ensure_ascii=False,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class ResponseCache:
+    """Thread-safe LRU cache of prompt responses with a time-to-live."""
+
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        ttl_seconds: float = 86400,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._entries: OrderedDict[str, tuple[float, str]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> str | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at <= self._clock():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: str) -> None:
+        if self.max_entries <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (self._clock() + self.ttl_seconds, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+@dataclass
+class ClientStats:
+    """Counters and latency samples collected by a client."""
+
+    calls: int = 0
+    cache_hits: int = 0
+    coalesced: int = 0
+    upstream_requests: int = 0
+    retries: int = 0
+    failures: int = 0
+    latencies: deque[float] = field(default_factory=lambda: deque(maxlen=LATENCY_SAMPLE_SIZE))
+
+    @property
+    def hit_rate(self) -> float:
+        return self.cache_hits / self.calls if self.calls else 0.0
+
+    def percentile(self, pct: float) -> float:
+        """Return the latency in seconds at the given percentile (0-100)."""
+
+        return percentile(self.latencies, pct)
+
+
+class _LoopState:
+    """Asyncio primitives owned by the client's background event loop."""
+
+    def __init__(self, max_concurrency: int) -> None:
+        self.semaphore = asyncio.Semaphore(max_concurrency)
+        self.rate_lock = asyncio.Lock()
+        self.next_slot = 0.0
+        self.inflight: dict[str, asyncio.Task[str]] = {}
+
+
+class GeminiClient:
+    """Client for the Gemini ``generateContent`` endpoint.
+
+    Identical prompts are answered from a content-hashed cache, and concurrent
+    calls for the same prompt share one upstream request. Upstream requests are
+    capped by a semaphore and spaced to respect ``requests_per_minute``.
+
+    All requests run on one background event loop owned by the client, so the
+    limits and coalescing hold across every caller, whether it awaits
+    :meth:`generate` from its own loop or calls :meth:`generate_sync` from a
+    thread.
+    """
+
+    def __init__(
+        self,
+        api_key: str | None = None,
+        *,
+        model: str | None = None,
+        base_url: str | None = None,
+        timeout: float | None = None,
+        max_concurrency: int | None = None,
+        requests_per_minute: int | None = None,
+        max_retries: int | None = None,
+        cache: ResponseCache | None = None,
+    ) -> None:
+        self.api_key = api_key or settings.gemini_api_key
+        if not self.api_key:
+            raise GeminiError("GEMINI_API_KEY is not configured.")
+        self.model = model or settings.gemini_model
+        self.base_url = (base_url or settings.gemini_base_url).rstrip("/")
+        self.timeout = timeout if timeout is not None else settings.gemini_timeout_seconds
+        self.max_concurrency = max_concurrency or settings.gemini_max_concurrency
+        rpm = requests_per_minute if requests_per_minute is not None else settings.gemini_requests_per_minute
+        self.min_interval = 60.0 / rpm if rpm > 0 else 0.0
+        self.max_retries = max_retries if max_retries is not None else settings.gemini_max_retries
+        self.cache = (
+            cache
+            if cache is not None
+            else ResponseCache(settings.gemini_cache_max_entries, settings.gemini_cache_ttl_seconds)
+        )
+        self.stats = ClientStats()
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._loop_thread: threading.Thread | None = None
+        self._loop_state: _LoopState | None = None
+        self._loop_lock = threading.Lock()
+
+    async def generate(
+        self, prompt: str, *, generation_config: dict[str, Any] | None = None
+    ) -> str:
+        """Return the model's text response for a prompt."""
+
+        future = asyncio.run_coroutine_threadsafe(
+            self._generate(prompt, generation_config), self._ensure_loop()
+        )
+        return await asyncio.wrap_future(future)
+
+    def generate_sync(
+        self, prompt: str, *, generation_config: dict[str, Any] | None = None
+    ) -> str:
+        """Blocking variant of :meth:`generate` for synchronous callers."""
+
+        future = asyncio.run_coroutine_threadsafe(
+            self._generate(prompt, generation_config), self._ensure_loop()
+        )
+        return future.result()
+
+    def close(self) -> None:
+        """Stop the background event loop and its thread."""
+
+        with self._loop_lock:
+            loop, thread = self._loop, self._loop_thread
+            self._loop, self._loop_thread, self._loop_state = None, None, None
+        if loop is not None:
+            loop.call_soon_threadsafe(loop.stop)
+            thread.join()
+            loop.close()
+
+    def __enter__(self) -> GeminiClient:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        with self._loop_lock:
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                thread = threading.Thread(target=loop.run_forever, name="gemini-client", daemon=True)
+                thread.start()
+                self._loop, self._loop_thread = loop, thread
+                self._loop_state = _LoopState(self.max_concurrency)
+            return self._loop
+
+    async def _generate(self, prompt: str, generation_config: dict[str, Any] | None) -> str:
+        # Runs on the background loop, so stats and state need no extra locking.
+        started = time.perf_counter()
+        self.stats.calls += 1
+        try:
+            key = cache_key(self.model, prompt, generation_config)
+            cached = self.cache.get(key)
+            if cached is not None:
+                self.stats.cache_hits += 1
+                return cached
+
+            state = self._loop_state
+            task = state.inflight.get(key)
+            if task is not None:
+                self.stats.coalesced += 1
+            else:
+                task = asyncio.ensure_future(self._fetch(key, prompt, generation_config, state))
+                state.inflight[key] = task
+                task.add_done_callback(lambda _: state.inflight.pop(key, None))
+            # Shield so one caller being cancelled does not cancel the shared request.
+            return await asyncio.shield(task)
+        finally:
+            self.stats.latencies.append(time.perf_counter() - started)
+
+    async def generate_many(
+        self, prompts: Iterable[str], *, generation_config: dict[str, Any] | None = None
+    ) -> list[str]:
+        """Return responses for many prompts, in order.
+
+        Duplicate prompts are sent once and cache hits are never sent, so a
+        batch of small prompts costs one upstream request per distinct miss.
+        """
+
+        prompts = list(prompts)
+        unique = list(dict.fromkeys(prompts))
+        results = await asyncio.gather(
+            *(self.generate(prompt, generation_config=generation_config) for prompt in unique)
+        )
+        by_prompt = dict(zip(unique, results))
+        return [by_prompt[prompt] for prompt in prompts]
+
+    async def _fetch(
+        self,
+        key: str,
+        prompt: str,
+        generation_config: dict[str, Any] | None,
+        state: _LoopState,
+    ) -> str:
+        payload: dict[str, Any] = {"contents": [{"role": "user", "parts": [{"text": prompt}]}]}
+        if generation_config:
+            payload["generationConfig"] = generation_config
+
+        attempt = 0
+        while True:
+            try:
+                async with state.semaphore:
+                    await self._wait_for_rate_slot(state)
+                    self.stats.upstream_requests += 1
+                    data = await asyncio.to_thread(self._post, payload)
+                text = _extract_text(data)
+                self.cache.set(key, text)
+                return text
+            except _RetryableError as exc:
+                if attempt >= self.max_retries:
+                    self.stats.failures += 1
+                    raise GeminiError(f"Gemini request failed after {attempt + 1} attempts: {exc}") from exc
+                # Full jitter keeps many clients from retrying in lockstep.
+                delay = random.uniform(0, min(MAX_BACKOFF_SECONDS, 0.5 * 2**attempt))
+                if exc.retry_after is not None:
+                    delay = max(delay, exc.retry_after)
+                attempt += 1
+                self.stats.retries += 1
+                await asyncio.sleep(delay)
+            except GeminiError:
+                self.stats.failures += 1
+                raise
+
+    async def _wait_for_rate_slot(self, state: _LoopState) -> None:
+        if not self.min_interval:
+            return
+        loop = asyncio.get_running_loop()
+        async with state.rate_lock:
+            now = loop.time()
+            wait = state.next_slot - now
+            state.next_slot = max(now, state.next_slot) + self.min_interval
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+    def _post(self, payload: dict[str, Any]) -> dict[str, Any]:
+        request = urllib.request.Request(
+            f"{self.base_url}/models/{self.model}:generateContent",
+            data=json.dumps(payload).encode("utf-8"),
+            headers={"Content-Type": "application/json", "x-goog-api-key": self.api_key},
+            method="POST",
+        )
+        try:
+            with urllib.request.urlopen(request, timeout=self.timeout) as response:
+                return json.loads(response.read().decode("utf-8"))
+        except urllib.error.HTTPError as exc:
+            exc.close()
+            message = f"HTTP {exc.code} from Gemini API."
+            if exc.code in RETRYABLE_STATUS_CODES:
+                raise _RetryableError(message, _parse_retry_after(exc.headers.get("Retry-After"))) from exc
+            raise GeminiError(message) from exc
+        except (urllib.error.URLError, TimeoutError, ConnectionError) as exc:
+            raise _RetryableError(f"Could not reach Gemini API: {exc}") from exc
+        except http.client.HTTPException as exc:
+            # e.g. IncompleteRead when the connection drops mid-body.
+            raise _RetryableError(f"Incomplete response from Gemini API: {exc!r}") from exc
+        except json.JSONDecodeError as exc:
+            raise GeminiError("Gemini API returned invalid JSON.") from exc
+
+
+def _parse_retry_after(value: str | None) -> float | None:
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        return None
+
+
+def _extract_text(data: dict[str, Any]) -> str:
+    try:
+        parts = data["candidates"][0]["content"]["parts"]
+    except (KeyError, IndexError, TypeError) as exc:
+        raise GeminiError("Gemini response contained no candidates.") from exc
+    text = "".join(part.get("text", "") for part in parts)
+    if not text:
+        raise GeminiError("Gemini response contained no text.")
+    return text
+
+
+__all__ = [
+    "ClientStats",
+    "GeminiClient",
+    "GeminiError",
+    "ResponseCache",
+    "cache_key",
+]
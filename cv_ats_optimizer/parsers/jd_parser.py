@@ -166,7 +166,7 @@ def extract_jd_sections(jd_text: str) -> JDStructured:
         contact_parts.append(f"Phone: {phone}")
     structured.recruiter_info = " | ".join(contact_parts) if contact_parts else "Not provided."
 
-    structured.keywords_for_ats = top_tokens(cleaned_text, 25)
+    structured.keywords_for_ats = top_tokens(cleaned_text, 25, normalize=True)
 
     return structured
 
@@ -0,0 +1,258 @@
+"""SQLite persistence for parsed CVs and job descriptions with FTS5 search."""
+
+from __future__ import annotations
+
+from dataclasses import asdict, dataclass
+import json
+from pathlib import Path
+import sqlite3
+import time
+from typing import Iterable
+
+from cv_ats_optimizer.config.settings import settings
+from cv_ats_optimizer.parsers.jd_parser import JDStructured
+from cv_ats_optimizer.utils.text_processor import tokenize_words
+from cv_ats_optimizer.utils.text_store import content_key
+
+JD_SEARCH_COLUMNS = {"job_title", "skills", "responsibilities", "keywords"}
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS cvs (
+    id INTEGER PRIMARY KEY,
+    content_hash TEXT NOT NULL UNIQUE,
+    filename TEXT NOT NULL DEFAULT '',
+    text TEXT NOT NULL,
+    created_at REAL NOT NULL
+);
+CREATE VIRTUAL TABLE IF NOT EXISTS cvs_fts USING fts5(
+    text, content='cvs', content_rowid='id', tokenize='porter unicode61'
+);
+CREATE TRIGGER IF NOT EXISTS cvs_after_insert AFTER INSERT ON cvs BEGIN
+    INSERT INTO cvs_fts(rowid, text) VALUES (new.id, new.text);
+END;
+CREATE TRIGGER IF NOT EXISTS cvs_after_delete AFTER DELETE ON cvs BEGIN
+    INSERT INTO cvs_fts(cvs_fts, rowid, text) VALUES ('delete', old.id, old.text);
+END;
+
+CREATE TABLE IF NOT EXISTS jds (
+    id INTEGER PRIMARY KEY,
+    content_hash TEXT NOT NULL UNIQUE,
+    job_title TEXT NOT NULL DEFAULT '',
+    company_name TEXT NOT NULL DEFAULT '',
+    location TEXT NOT NULL DEFAULT '',
+    skills TEXT NOT NULL DEFAULT '',
+    responsibilities TEXT NOT NULL DEFAULT '',
+    keywords TEXT NOT NULL DEFAULT '',
+    text TEXT NOT NULL,
+    data TEXT NOT NULL,
+    created_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS jds_company_idx ON jds(company_name);
+CREATE VIRTUAL TABLE IF NOT EXISTS jds_fts USING fts5(
+    job_title, skills, responsibilities, keywords, content='jds', content_rowid='id',
+    tokenize='porter unicode61'
+);
+CREATE TRIGGER IF NOT EXISTS jds_after_insert AFTER INSERT ON jds BEGIN
+    INSERT INTO jds_fts(rowid, job_title, skills, responsibilities, keywords)
+    VALUES (new.id, new.job_title, new.skills, new.responsibilities, new.keywords);
+END;
+CREATE TRIGGER IF NOT EXISTS jds_after_delete AFTER DELETE ON jds BEGIN
+    INSERT INTO jds_fts(jds_fts, rowid, job_title, skills, responsibilities, keywords)
+    VALUES ('delete', old.id, old.job_title, old.skills, old.responsibilities, old.keywords);
+END;
+CREATE TRIGGER IF NOT EXISTS jds_after_update AFTER UPDATE ON jds BEGIN
+    INSERT INTO jds_fts(jds_fts, rowid, job_title, skills, responsibilities, keywords)
+    VALUES ('delete', old.id, old.job_title, old.skills, old.responsibilities, old.keywords);
+    INSERT INTO jds_fts(rowid, job_title, skills, responsibilities, keywords)
+    VALUES (new.id, new.job_title, new.skills, new.responsibilities, new.keywords);
+END;
+"""
+
+
+class DocumentStoreError(RuntimeError):
+    """Raised when a search query cannot be run."""
+
+
+@dataclass
+class CVRecord:
+    id: int
+    filename: str
+    text: str
+    created_at: float
+
+
+@dataclass
+class JDRecord:
+    id: int
+    text: str
+    structured: JDStructured
+    created_at: float
+
+
+def _fts_query(query: str, columns: Iterable[str] | None, match_any: bool) -> str:
+    terms = [f'"{token}"' for token in dict.fromkeys(tokenize_words(query))]
+    if not terms:
+        raise DocumentStoreError("Search query contains no searchable words.")
+    expression = (" OR " if match_any else " AND ").join(terms)
+    if columns:
+        columns = list(columns)
+        unknown = set(columns) - JD_SEARCH_COLUMNS
+        if unknown:
+            raise DocumentStoreError(f"Unknown search columns: {', '.join(sorted(unknown))}.")
+        expression = f"{{{' '.join(columns)}}} : ({expression})"
+    return expression
+
+
+class DocumentStore:
+    """Local SQLite database of parsed CVs and JDs.
+
+    The database runs in WAL mode so readers in other connections are not
+    blocked by a writer. A connection must stay on the thread that opened it;
+    open one store per thread or process.
+    """
+
+    def __init__(self, path: str | Path | None = None) -> None:
+        path = str(path or settings.database_path)
+        if path != ":memory:":
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self.path = path
+        self._conn = sqlite3.connect(path)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def __enter__(self) -> DocumentStore:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def add_cvs(self, items: Iterable[tuple[str, str]]) -> int:
+        """Insert ``(filename, text)`` pairs in one transaction.
+
+        Texts already stored are skipped. Returns the number of new rows.
+        """
+
+        now = time.time()
+        rows = ((content_key(text), filename, text, now) for filename, text in items)
+        with self._conn:
+            cursor = self._conn.executemany(
+                "INSERT OR IGNORE INTO cvs (content_hash, filename, text, created_at)"
+                " VALUES (?, ?, ?, ?)",
+                rows,
+            )
+            return cursor.rowcount
+
+    def add_jds(self, items: Iterable[tuple[str, JDStructured]]) -> int:
+        """Insert or refresh ``(jd_text, structured)`` pairs in one transaction.
+
+        JDs are deduplicated by their source text. Re-adding a stored JD, for
+        example after re-parsing it with a newer parser, replaces its parsed
+        fields and search index entry instead of adding a row. Returns the
+        number of new rows.
+        """
+
+        now = time.time()
+        rows = (self._jd_row(text, structured, now) for text, structured in items)
+        with self._conn:
+            before = self.count_jds()
+            self._conn.executemany(
+                "INSERT INTO jds (content_hash, job_title, company_name, location,"
+                " skills, responsibilities, keywords, text, data, created_at)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"
+                " ON CONFLICT(content_hash) DO UPDATE SET"
+                " job_title = excluded.job_title, company_name = excluded.company_name,"
+                " location = excluded.location, skills = excluded.skills,"
+                " responsibilities = excluded.responsibilities, keywords = excluded.keywords,"
+                " data = excluded.data"
+                " WHERE jds.data != excluded.data",
+                rows,
+            )
+            return self.count_jds() - before
+
+    def search_cvs(self, query: str, limit: int = 20, *, match_any: bool = False) -> list[CVRecord]:
+        """Return CVs matching all (or with ``match_any`` any) words, best first."""
+
+        sql = (
+            "SELECT cvs.id, cvs.filename, cvs.text, cvs.created_at FROM cvs_fts"
+            " JOIN cvs ON cvs.id = cvs_fts.rowid"
+            " WHERE cvs_fts MATCH ? ORDER BY bm25(cvs_fts) LIMIT ?"
+        )
+        rows = self._conn.execute(sql, (_fts_query(query, None, match_any), limit))
+        return [CVRecord(row["id"], row["filename"], row["text"], row["created_at"]) for row in rows]
+
+    def search_jds(
+        self,
+        query: str,
+        limit: int = 20,
+        *,
+        columns: Iterable[str] | None = None,
+        match_any: bool = False,
+    ) -> list[JDRecord]:
+        """Return JDs matching the query words, best first.
+
+        ``columns`` restricts matching to any of ``job_title``, ``skills``,
+        ``responsibilities`` and ``keywords``.
+        """
+
+        sql = (
+            "SELECT jds.id, jds.text, jds.data, jds.created_at FROM jds_fts"
+            " JOIN jds ON jds.id = jds_fts.rowid"
+            " WHERE jds_fts MATCH ? ORDER BY bm25(jds_fts) LIMIT ?"
+        )
+        rows = self._conn.execute(sql, (_fts_query(query, columns, match_any), limit))
+        return [self._jd_record(row) for row in rows]
+
+    def get_jd(self, jd_id: int) -> JDRecord | None:
+        row = self._conn.execute(
+            "SELECT id, text, data, created_at FROM jds WHERE id = ?", (jd_id,)
+        ).fetchone()
+        return self._jd_record(row) if row else None
+
+    def find_jd(self, jd_text: str) -> JDRecord | None:
+        """Return the stored JD parsed from exactly this text, if any."""
+
+        row = self._conn.execute(
+            "SELECT id, text, data, created_at FROM jds WHERE content_hash = ?",
+            (content_key(jd_text),),
+        ).fetchone()
+        return self._jd_record(row) if row else None
+
+    def count_cvs(self) -> int:
+        return self._conn.execute("SELECT COUNT(*) FROM cvs").fetchone()[0]
+
+    def count_jds(self) -> int:
+        return self._conn.execute("SELECT COUNT(*) FROM jds").fetchone()[0]
+
+    @staticmethod
+    def _jd_row(text: str, structured: JDStructured, now: float) -> tuple:
+        return (
+            content_key(text),
+            structured.job_title,
+            structured.company_name,
+            structured.location,
+            "\n".join(structured.required_skills + structured.preferred_skills),
+            "\n".join(structured.key_responsibilities),
+            " ".join(structured.keywords_for_ats),
+            text,
+            json.dumps(asdict(structured), ensure_ascii=False, sort_keys=True),
+            now,
+        )
+
+    @staticmethod
+    def _jd_record(row: sqlite3.Row) -> JDRecord:
+        return JDRecord(
+            row["id"], row["text"], JDStructured(**json.loads(row["data"])), row["created_at"]
+        )
+
+
+__all__ = [
+    "CVRecord",
+    "DocumentStore",
+    "DocumentStoreError",
+    "JDRecord",
+]
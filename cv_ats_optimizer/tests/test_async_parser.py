@@ -0,0 +1,104 @@
+import asyncio
+import multiprocessing
+import time
+
+import pytest
+
+from cv_ats_optimizer.utils import async_parser
+from cv_ats_optimizer.utils.async_parser import parse_file_async, parse_many_async
+from cv_ats_optimizer.utils.file_parser import FileParsingError, parse_file
+
+
+def _hang_on_stuck_files(filename, file_bytes):
+    if filename.startswith("stuck"):
+        time.sleep(60)
+    return parse_file(filename, file_bytes)
+
+
+async def _collect(files, **kwargs):
+    return [result async for result in parse_many_async(files, **kwargs)]
+
+
+@pytest.mark.parametrize("executor", ["thread", "process"])
+def test_parse_file_async_returns_text(executor):
+    text = asyncio.run(parse_file_async("cv.txt", b"Hello World", executor=executor))
+    assert text == "Hello World"
+
+
+def test_parse_many_async_isolates_failures_and_timeouts(monkeypatch):
+    monkeypatch.setattr(async_parser, "parse_file", _hang_on_stuck_files)
+    files = [
+        ("stuck.txt", b"never finishes"),
+        ("cv.txt", b"Python developer"),
+        ("notes.rtf", b"unsupported"),
+    ]
+
+    started = time.perf_counter()
+    results = asyncio.run(_collect(files, executor="thread", timeout=0.5, max_concurrency=3))
+
+    assert time.perf_counter() - started < 5
+    by_index = {result.index: result for result in results}
+    assert by_index[1].text == "Python developer"
+    assert "Unsupported file extension" in by_index[2].error
+    assert "Timed out" in by_index[0].error
+    assert results[-1].index == 0
+
+
+def test_parse_many_async_pulls_files_lazily():
+    pulled = []
+
+    def files():
+        for index in range(10):
+            pulled.append(index)
+            yield f"cv{index}.txt", b"Python developer"
+
+    async def first_then_rest():
+        results = parse_many_async(files(), executor="thread", max_concurrency=2)
+        first = await results.__anext__()
+        pulled_before_first = len(pulled)
+        rest = [result async for result in results]
+        return pulled_before_first, [first, *rest]
+
+    pulled_before_first, results = asyncio.run(first_then_rest())
+
+    # At most max_concurrency in flight, plus the finished ones being yielded.
+    assert pulled_before_first <= 4
+    assert sorted(result.index for result in results) == list(range(10))
+
+
+@pytest.mark.skipif(
+    multiprocessing.get_start_method() != "fork",
+    reason="monkeypatched parser is only inherited by forked workers",
+)
+def test_process_executor_kills_hung_worker(monkeypatch):
+    monkeypatch.setattr(async_parser, "parse_file", _hang_on_stuck_files)
+
+    started = time.perf_counter()
+    with pytest.raises(FileParsingError, match="Timed out"):
+        asyncio.run(parse_file_async("stuck.pdf", b"", executor="process", timeout=0.5))
+
+    assert time.perf_counter() - started < 5
+    assert not multiprocessing.active_children()
+
+
+@pytest.mark.skipif(
+    multiprocessing.get_start_method() != "fork",
+    reason="monkeypatched parser is only inherited by forked workers",
+)
+def test_cancelling_process_parse_kills_worker(monkeypatch):
+    monkeypatch.setattr(async_parser, "parse_file", _hang_on_stuck_files)
+
+    async def cancel_midway():
+        task = asyncio.ensure_future(
+            parse_file_async("stuck.pdf", b"", executor="process", timeout=30)
+        )
+        await asyncio.sleep(0.3)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    started = time.perf_counter()
+    asyncio.run(cancel_midway())
+
+    assert time.perf_counter() - started < 5
+    assert not multiprocessing.active_children()
@@ -0,0 +1,56 @@
+import pytest
+
+from cv_ats_optimizer.parsers.jd_parser import JDStructured
+from cv_ats_optimizer.storage.document_store import DocumentStore, DocumentStoreError
+
+
+@pytest.fixture
+def store(tmp_path):
+    with DocumentStore(tmp_path / "documents.db") as document_store:
+        yield document_store
+
+
+def _jd(title, skills, responsibilities):
+    text = f"Job Title: {title}\nRequirements: {', '.join(skills)}"
+    return text, JDStructured(
+        job_title=title,
+        company_name="Tech Innovators Inc.",
+        required_skills=skills,
+        key_responsibilities=responsibilities,
+        keywords_for_ats=[skill.lower() for skill in skills],
+    )
+
+
+def test_add_and_search_jds(store):
+    inserted = store.add_jds(
+        [
+            _jd("Backend Engineer", ["Python", "PostgreSQL"], ["Build new services"]),
+            _jd("Frontend Engineer", ["TypeScript", "React"], ["Build Python tooling"]),
+        ]
+    )
+    assert inserted == 2
+    text, reparsed = _jd("Backend Engineer", ["Python", "PostgreSQL"], ["Build new services"])
+    reparsed.keywords_for_ats = ["python"]
+    assert store.add_jds([(text, reparsed)]) == 0
+    assert store.count_jds() == 2
+    assert store.find_jd(text).structured.keywords_for_ats == ["python"]
+    assert len(store.search_jds("postgresql", columns=["keywords"])) == 0
+
+    results = store.search_jds("python", columns=["skills"])
+    assert [record.structured.job_title for record in results] == ["Backend Engineer"]
+    assert results[0].structured.required_skills == ["Python", "PostgreSQL"]
+
+    assert len(store.search_jds("python")) == 2
+    assert len(store.search_jds("react postgresql", match_any=True)) == 2
+    assert len(store.search_jds("builds", columns=["responsibilities"])) == 2
+
+
+def test_add_and_search_cvs(store):
+    assert store.add_cvs([("a.pdf", "Data engineer with Spark"), ("b.txt", "Designer")]) == 2
+
+    results = store.search_cvs("spark")
+    assert [record.filename for record in results] == ["a.pdf"]
+    assert [record.filename for record in store.search_cvs("engineering")] == ["a.pdf"]
+
+    with pytest.raises(DocumentStoreError):
+        store.search_cvs("!!!")
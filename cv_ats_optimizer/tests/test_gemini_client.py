@@ -0,0 +1,168 @@
+import asyncio
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import json
+import threading
+import time
+
+import pytest
+
+from cv_ats_optimizer.llm.gemini_client import GeminiClient, GeminiError, ResponseCache
+
+
+class _FakeGemini(BaseHTTPRequestHandler):
+    requests = 0
+    failures_left = 0
+    truncated_left = 0
+    delay = 0.0
+    active = 0
+    peak_active = 0
+    lock = threading.Lock()
+
+    def do_POST(self):
+        body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        cls = type(self)
+        with cls.lock:
+            cls.requests += 1
+            cls.active += 1
+            cls.peak_active = max(cls.peak_active, cls.active)
+        time.sleep(self.delay)
+        with cls.lock:
+            cls.active -= 1
+        if type(self).failures_left > 0:
+            type(self).failures_left -= 1
+            self.send_response(503)
+            self.end_headers()
+            return
+        prompt = body["contents"][0]["parts"][0]["text"]
+        reply = {"candidates": [{"content": {"parts": [{"text": f"echo: {prompt}"}]}}]}
+        payload = json.dumps(reply).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        if cls.truncated_left > 0:
+            cls.truncated_left -= 1
+            self.wfile.write(payload[:10])
+            self.close_connection = True
+            return
+        self.wfile.write(payload)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def fake_server():
+    _FakeGemini.requests = 0
+    _FakeGemini.failures_left = 0
+    _FakeGemini.truncated_left = 0
+    _FakeGemini.delay = 0.0
+    _FakeGemini.active = 0
+    _FakeGemini.peak_active = 0
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _FakeGemini)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_port}"
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def make_client(fake_server):
+    clients = []
+
+    def make(**kwargs):
+        kwargs.setdefault("requests_per_minute", 0)
+        client = GeminiClient("test-key", base_url=fake_server, **kwargs)
+        clients.append(client)
+        return client
+
+    yield make
+    for client in clients:
+        client.close()
+
+
+def test_identical_prompts_are_coalesced_and_cached(make_client):
+    _FakeGemini.delay = 0.05
+    client = make_client()
+
+    async def run():
+        first = await asyncio.gather(*(client.generate("Rewrite my summary") for _ in range(10)))
+        second = await client.generate("Rewrite my summary")
+        return first, second
+
+    first, second = asyncio.run(run())
+
+    assert set(first) == {"echo: Rewrite my summary"}
+    assert second == "echo: Rewrite my summary"
+    assert _FakeGemini.requests == 1
+    assert client.stats.coalesced == 9
+    assert client.stats.cache_hits == 1
+    assert client.stats.percentile(99) > 0
+
+
+def test_generate_many_sends_each_distinct_prompt_once(make_client):
+    client = make_client(max_concurrency=2)
+
+    results = asyncio.run(client.generate_many(["a", "b", "a", "c"]))
+
+    assert results == ["echo: a", "echo: b", "echo: a", "echo: c"]
+    assert _FakeGemini.requests == 3
+
+
+def test_retries_transient_errors_then_gives_up(make_client):
+    _FakeGemini.failures_left = 1
+    client = make_client(max_retries=2)
+    assert client.generate_sync("hello") == "echo: hello"
+    assert client.stats.retries == 1
+
+    _FakeGemini.failures_left = 10
+    client = make_client(max_retries=1)
+    with pytest.raises(GeminiError):
+        client.generate_sync("goodbye")
+
+
+def test_truncated_responses_are_retried(make_client):
+    _FakeGemini.truncated_left = 1
+    client = make_client(max_retries=1)
+    assert client.generate_sync("hello") == "echo: hello"
+    assert client.stats.retries == 1
+
+    _FakeGemini.truncated_left = 10
+    with pytest.raises(GeminiError):
+        client.generate_sync("goodbye")
+    assert client.stats.failures == 1
+
+
+def test_sync_callers_on_many_threads_share_limits(make_client):
+    _FakeGemini.delay = 0.05
+    client = make_client(max_concurrency=1)
+
+    def call(prompt):
+        results.append(client.generate_sync(prompt))
+
+    results = []
+    threads = [threading.Thread(target=call, args=(f"prompt {i % 4}",)) for i in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(results) == 8
+    assert _FakeGemini.requests == 4
+    assert _FakeGemini.peak_active == 1
+
+
+def test_sync_callers_respect_rate_limit(make_client):
+    client = make_client(requests_per_minute=600)
+
+    started = time.perf_counter()
+    for i in range(3):
+        client.generate_sync(f"prompt {i}")
+
+    assert time.perf_counter() - started >= 0.2
+
+
+def test_injected_empty_cache_is_used():
+    cache = ResponseCache(max_entries=10, ttl_seconds=5)
+    assert GeminiClient("test-key", cache=cache).cache is cache
@@ -0,0 +1,32 @@
+from cv_ats_optimizer.utils.ingest import (
+    parse_stored_jd,
+    read_upload,
+    store_cv,
+    store_job_description,
+)
+from cv_ats_optimizer.utils.text_store import SharedTextStore
+
+JD_TEXT = (
+    "Job Title: Data Engineer\n\nResponsibilities\n- Build data pipelines\n\n"
+    "Requirements\n- Python, SQL\n" + "We value ownership and collaboration. " * 5
+)
+
+
+def test_read_upload_reports_unsupported_files():
+    result = read_upload("cv.rtf", b"text", "CV file")
+
+    assert not result.ok
+    assert "Unsupported file type" in result.message
+
+
+def test_sessions_on_same_jd_share_text_and_parse():
+    store = SharedTextStore(max_bytes=1024 * 1024)
+    first = store_job_description(JD_TEXT, store)
+    second = store_job_description(JD_TEXT, store)
+
+    assert first.ok and second.ok
+    assert first.handle.key == second.handle.key
+    parsed = parse_stored_jd(first.handle, store)
+    assert parse_stored_jd(second.handle, store).get() is parsed.get()
+    assert parsed.get().job_title == "Data Engineer"
+    assert not store_cv("too short", store).ok
@@ -0,0 +1,28 @@
+from cv_ats_optimizer.benchmarks.load_test import format_report, run_load_test
+
+
+def test_run_load_test_reports_every_stage():
+    report = run_load_test(sessions=6, mode="thread", workers=2)
+
+    assert report.sessions == 6
+    assert report.failed_sessions == 0
+    counts = {stage.stage: stage.count for stage in report.stages}
+    assert counts == {
+        "handle_file_upload": 12,
+        "validate_cv": 6,
+        "validate_job_description": 6,
+        "extract_jd_sections": 6,
+    }
+    assert report.session_p99_ms >= report.session_p50_ms > 0
+    assert "extract_jd_sections" in format_report(report)
+
+
+def test_each_run_has_its_own_jd_memo():
+    first = run_load_test(sessions=12, mode="thread", workers=2, distinct=1, mix={".txt": 1})
+    second = run_load_test(sessions=12, mode="thread", workers=2, distinct=1, mix={".txt": 1})
+    direct = run_load_test(
+        sessions=12, mode="thread", workers=2, distinct=1, mix={".txt": 1}, direct_parse=True
+    )
+
+    assert first.jd_memo_hit_rate == second.jd_memo_hit_rate == 11 / 12
+    assert direct.jd_memo_hit_rate == 0.0
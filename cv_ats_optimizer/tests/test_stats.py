@@ -0,0 +1,11 @@
+from cv_ats_optimizer.utils.stats import percentile
+
+
+def test_percentile_uses_nearest_rank():
+    values = [4.0, 1.0, 3.0, 2.0]
+
+    assert percentile(values, 50) == 2.0
+    assert percentile(values, 75) == 3.0
+    assert percentile(values, 99) == 4.0
+    assert percentile(values, 0) == 1.0
+    assert percentile([], 95) == 0.0
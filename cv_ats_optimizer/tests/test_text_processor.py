@@ -0,0 +1,22 @@
+from cv_ats_optimizer.utils.text_processor import (
+    normalization_cache_info,
+    normalize_token,
+    normalize_tokens,
+    top_tokens,
+)
+
+
+def test_normalize_tokens_groups_inflections():
+    normalized = normalize_tokens(["developing", "developed", "developer", "python"])
+
+    assert normalized[:3] == ["develop"] * 3
+    assert normalized[3] == "python"
+    assert normalize_token("developers") == "develop"
+    assert normalization_cache_info().currsize >= 5
+
+
+def test_top_tokens_normalized_counts_inflections_together():
+    text = "Python python developing developed developer testing tests"
+
+    assert top_tokens(text, 2) == ["python", "developing"]
+    assert top_tokens(text, 2, normalize=True) == ["developing", "python"]
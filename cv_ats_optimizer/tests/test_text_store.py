@@ -0,0 +1,77 @@
+from concurrent.futures import ThreadPoolExecutor
+import gc
+import threading
+import time
+
+from cv_ats_optimizer.parsers.jd_parser import JDStructured
+from cv_ats_optimizer.utils.text_store import SharedTextStore
+
+
+def test_identical_texts_share_one_entry():
+    store = SharedTextStore(max_bytes=1024 * 1024)
+    first = store.put("Senior Python Engineer")
+    second = store.put("Senior Python Engineer")
+
+    assert first.key == second.key
+    assert len(store) == 1
+
+    first.release()
+    assert second.get() == "Senior Python Engineer"
+
+
+def test_get_or_create_builds_value_once():
+    store = SharedTextStore(max_bytes=1024 * 1024)
+    calls = []
+
+    def factory():
+        calls.append(1)
+        return JDStructured(job_title="Data Engineer")
+
+    first = store.get_or_create("jd_structured:abc", factory)
+    second = store.get_or_create("jd_structured:abc", factory)
+
+    assert len(calls) == 1
+    assert second.get() is first.get()
+
+
+def test_concurrent_get_or_create_waits_for_first_build():
+    store = SharedTextStore(max_bytes=1024 * 1024)
+    calls = []
+    lock = threading.Lock()
+
+    def factory():
+        with lock:
+            calls.append(1)
+        time.sleep(0.05)
+        return JDStructured(job_title="Data Engineer")
+
+    with ThreadPoolExecutor(max_workers=10) as pool:
+        handles = list(pool.map(lambda _: store.get_or_create("jd_structured:abc", factory), range(10)))
+
+    assert len(calls) == 1
+    assert all(handle.get() is handles[0].get() for handle in handles)
+
+
+def test_memory_cap_never_evicts_live_handles():
+    store = SharedTextStore(max_bytes=300)
+    handles = [store.put(letter * 100) for letter in "abc"]
+
+    assert [handle.get() for handle in handles] == ["a" * 100, "b" * 100, "c" * 100]
+    assert store.total_bytes > 300
+
+
+def test_memory_cap_evicts_released_entries_first():
+    store = SharedTextStore(max_bytes=300)
+    cold = store.put("a" * 100)
+    cold_key = cold.key
+    warm = store.put("b" * 100)
+    del cold
+    gc.collect()
+    assert cold_key in store
+
+    hot = store.put("c" * 100)
+
+    assert cold_key not in store
+    assert warm.get() == "b" * 100
+    assert hot.get() == "c" * 100
+    assert store.total_bytes <= 300
@@ -0,0 +1,189 @@
+"""Async file parsing with per-document deadlines and bounded concurrency."""
+
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass
+import itertools
+import multiprocessing
+from multiprocessing.connection import Connection
+import threading
+import time
+from typing import AsyncIterator, Iterable
+
+from cv_ats_optimizer.config.settings import settings
+from cv_ats_optimizer.utils.file_parser import FileParsingError, parse_file
+
+EXECUTORS = {"process", "thread"}
+
+
+@dataclass
+class ParseResult:
+    """Outcome of parsing one document in a batch."""
+
+    index: int
+    filename: str
+    text: str | None = None
+    error: str | None = None
+    elapsed: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+def _error_message(exc: BaseException) -> str:
+    return str(exc) or exc.__class__.__name__
+
+
+def _parse_in_child(conn: Connection, filename: str, file_bytes: bytes) -> None:
+    try:
+        conn.send((True, parse_file(filename, file_bytes)))
+    except Exception as exc:  # Reported back to the parent.
+        conn.send((False, _error_message(exc)))
+    finally:
+        conn.close()
+
+
+def _receive(receiver: Connection, timeout: float) -> tuple[bool, str] | None:
+    """Wait for the child's message off the event loop; None means timed out.
+
+    The receiver is always closed here, so a cancelled caller cannot leak it.
+    """
+
+    try:
+        # poll() also returns once the child exits, so a crash surfaces as EOFError.
+        if not receiver.poll(timeout):
+            return None
+        return receiver.recv()
+    finally:
+        receiver.close()
+
+
+async def _parse_in_process(filename: str, file_bytes: bytes, timeout: float) -> str:
+    ctx = multiprocessing.get_context()
+    receiver, sender = ctx.Pipe(duplex=False)
+    process = ctx.Process(
+        target=_parse_in_child, args=(sender, filename, file_bytes), daemon=True
+    )
+    process.start()
+    sender.close()
+    try:
+        message = await asyncio.to_thread(_receive, receiver, timeout)
+    except EOFError as exc:
+        raise FileParsingError(f"Parser process for {filename} exited unexpectedly.") from exc
+    finally:
+        # Killing the child also wakes a poll() abandoned by a cancelled caller.
+        if process.is_alive():
+            process.kill()
+        await asyncio.to_thread(process.join)
+    if message is None:
+        raise FileParsingError(f"Timed out parsing {filename} after {timeout:g} seconds.")
+    ok, payload = message
+    if not ok:
+        raise FileParsingError(payload)
+    return payload
+
+
+async def _parse_in_thread(filename: str, file_bytes: bytes, timeout: float) -> str:
+    loop = asyncio.get_running_loop()
+    future: asyncio.Future[str] = loop.create_future()
+
+    def settle(ok: bool, payload: str) -> None:
+        if future.done():
+            return
+        if ok:
+            future.set_result(payload)
+        else:
+            future.set_exception(FileParsingError(payload))
+
+    def worker() -> None:
+        try:
+            result = (True, parse_file(filename, file_bytes))
+        except Exception as exc:  # Reported back to the loop.
+            result = (False, _error_message(exc))
+        try:
+            loop.call_soon_threadsafe(settle, *result)
+        except RuntimeError:
+            pass  # Event loop already closed; nobody is waiting any more.
+
+    # A dedicated daemon thread, so a hung parse cannot exhaust a shared pool
+    # or block interpreter shutdown. Threads cannot be killed, only abandoned.
+    threading.Thread(target=worker, name=f"parse-{filename}", daemon=True).start()
+    try:
+        return await asyncio.wait_for(future, timeout)
+    except asyncio.TimeoutError as exc:
+        raise FileParsingError(f"Timed out parsing {filename} after {timeout:g} seconds.") from exc
+
+
+async def parse_file_async(
+    filename: str,
+    file_bytes: bytes,
+    *,
+    timeout: float | None = None,
+    executor: str | None = None,
+) -> str:
+    """Parse a file off the event loop, raising FileParsingError past the deadline.
+
+    The ``process`` executor runs each document in its own worker process and
+    kills it on timeout. The ``thread`` executor is cheaper but a timed out
+    worker keeps running in the background until the parser returns.
+    """
+
+    timeout = settings.parse_timeout_seconds if timeout is None else timeout
+    executor = executor or settings.parse_executor
+    if executor not in EXECUTORS:
+        raise ValueError(f"Unknown parse executor: {executor}.")
+    if executor == "process":
+        return await _parse_in_process(filename, file_bytes, timeout)
+    return await _parse_in_thread(filename, file_bytes, timeout)
+
+
+async def parse_many_async(
+    files: Iterable[tuple[str, bytes]],
+    *,
+    timeout: float | None = None,
+    executor: str | None = None,
+    max_concurrency: int | None = None,
+) -> AsyncIterator[ParseResult]:
+    """Parse many ``(filename, bytes)`` pairs, yielding results as they complete.
+
+    ``files`` is consumed lazily: at most ``max_concurrency`` documents are
+    read and in flight at once, so a generator over a large corpus never has
+    to be held in memory. Failures and timeouts are reported on the result
+    instead of raised, so one bad document never stops the batch.
+    ``ParseResult.index`` gives the position of the document in ``files``.
+    """
+
+    limit = max_concurrency or settings.parse_max_concurrency
+
+    async def run_one(index: int, filename: str, file_bytes: bytes) -> ParseResult:
+        started = time.perf_counter()
+        try:
+            text = await parse_file_async(filename, file_bytes, timeout=timeout, executor=executor)
+        except FileParsingError as exc:
+            return ParseResult(index, filename, error=str(exc), elapsed=time.perf_counter() - started)
+        return ParseResult(index, filename, text=text, elapsed=time.perf_counter() - started)
+
+    documents = enumerate(files)
+    pending: set[asyncio.Task[ParseResult]] = set()
+    done: set[asyncio.Task[ParseResult]] = set()
+    try:
+        while True:
+            # Refill before yielding so workers stay busy while the caller
+            # handles finished results.
+            for index, (filename, file_bytes) in itertools.islice(documents, limit - len(pending)):
+                pending.add(asyncio.ensure_future(run_one(index, filename, file_bytes)))
+            for task in done:
+                yield task.result()
+            if not pending:
+                break
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+    finally:
+        # Stopping iteration early cancels pending work and kills its workers.
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+
+
+__all__ = ["ParseResult", "parse_file_async", "parse_many_async"]
@@ -0,0 +1,76 @@
+"""UI-independent upload, validation and storage steps used by the app."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Callable
+
+from cv_ats_optimizer.parsers.jd_parser import JDStructured, extract_jd_sections
+from cv_ats_optimizer.utils.file_parser import FileParsingError, parse_file
+from cv_ats_optimizer.utils.text_store import SharedTextStore, TextHandle, text_store
+from cv_ats_optimizer.utils.validators import InputValidator, ValidationResult
+
+validator = InputValidator()
+
+
+@dataclass
+class IngestResult:
+    ok: bool
+    message: str
+    text: str | None = None
+    handle: TextHandle | None = None
+
+
+def read_upload(filename: str, file_bytes: bytes, label: str) -> IngestResult:
+    """Check an uploaded file's extension and size, then parse it to text."""
+
+    extension_result = validator.validate_file_extension(filename)
+    if not extension_result.is_valid:
+        return IngestResult(False, extension_result.message)
+    size_result = validator.validate_file_size(len(file_bytes))
+    if not size_result.is_valid:
+        return IngestResult(False, size_result.message)
+    try:
+        content = parse_file(filename, file_bytes)
+    except FileParsingError as exc:
+        return IngestResult(False, f"Failed to parse {label}: {exc}")
+    return IngestResult(True, "File parsed.", text=content)
+
+
+def _store_if_valid(
+    text: str, result: ValidationResult, store: SharedTextStore
+) -> IngestResult:
+    if not result.is_valid:
+        return IngestResult(False, result.message)
+    return IngestResult(True, result.message, text=text, handle=store.put(text))
+
+
+def store_cv(text: str, store: SharedTextStore = text_store) -> IngestResult:
+    """Validate CV text and put it in the shared store."""
+
+    return _store_if_valid(text, validator.validate_cv(text), store)
+
+
+def store_job_description(text: str, store: SharedTextStore = text_store) -> IngestResult:
+    """Validate job description text and put it in the shared store."""
+
+    return _store_if_valid(text, validator.validate_job_description(text), store)
+
+
+def parse_stored_jd(
+    jd_handle: TextHandle,
+    store: SharedTextStore = text_store,
+    parser: Callable[[str], JDStructured] = extract_jd_sections,
+) -> TextHandle:
+    """Return a handle to the parsed JD, parsing each distinct JD text only once."""
+
+    return store.get_or_create(f"jd_structured:{jd_handle.key}", lambda: parser(jd_handle.get()))
+
+
+__all__ = [
+    "IngestResult",
+    "parse_stored_jd",
+    "read_upload",
+    "store_cv",
+    "store_job_description",
+]
@@ -0,0 +1,18 @@
+"""Small statistics helpers shared by clients and benchmarks."""
+
+from __future__ import annotations
+
+from typing import Iterable
+
+
+def percentile(values: Iterable[float], pct: float) -> float:
+    """Return the nearest-rank value at the given percentile (0-100), or 0.0 if empty."""
+
+    ordered = sorted(values)
+    if not ordered:
+        return 0.0
+    index = min(len(ordered) - 1, max(0, round(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+__all__ = ["percentile"]
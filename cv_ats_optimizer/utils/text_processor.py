@@ -4,8 +4,11 @@ from __future__ import annotations
 
 import re
 from collections import Counter
+from functools import lru_cache
 from typing import Iterable, List
 
+from cv_ats_optimizer.config.settings import settings
+
 _WORD_RE = re.compile(r"[A-Za-z0-9']+")
 _EMAIL_RE = re.compile(r"[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}")
 _PHONE_RE = re.compile(
@@ -56,15 +59,106 @@ def count_words(text: str) -> int:
     return len(tokenize_words(text))
 
 
-def top_tokens(text: str, limit: int = 25) -> list[str]:
-    """Return the most frequent tokens within the text up to limit."""
+@lru_cache(maxsize=1)
+def get_stemmer():
+    """Return the shared NLTK Snowball stemmer, importing NLTK on first use."""
+
+    from nltk.stem.snowball import SnowballStemmer
+
+    return SnowballStemmer("english")
+
+
+@lru_cache(maxsize=1)
+def get_lemmatizer():
+    """Return the shared NLTK WordNet lemmatizer, importing NLTK on first use."""
+
+    from nltk.stem import WordNetLemmatizer
+
+    lemmatizer = WordNetLemmatizer()
+    try:
+        lemmatizer.lemmatize("warmup")
+    except LookupError as exc:
+        raise LookupError(
+            "Lemmatization needs the NLTK WordNet corpus: run nltk.download('wordnet')."
+        ) from exc
+    return lemmatizer
+
+
+def warm_normalizer(method: str = "stem") -> None:
+    """Load NLTK now so the first request in a process does not pay for the import."""
+
+    if method == "stem":
+        get_stemmer()
+    elif method == "lemma":
+        get_lemmatizer()
+    else:
+        raise ValueError(f"Unknown normalization method: {method}.")
+
+
+@lru_cache(maxsize=settings.normalization_cache_size)
+def _normalize_cached(token: str, method: str) -> str:
+    if method == "stem":
+        return get_stemmer().stem(token)
+    if method == "lemma":
+        return get_lemmatizer().lemmatize(token)
+    raise ValueError(f"Unknown normalization method: {method}.")
+
+
+def normalize_token(token: str, method: str = "stem") -> str:
+    """Reduce a lowercase token to its stem or lemma.
+
+    Results are memoized per process; token frequencies are heavily skewed, so
+    most lookups are cache hits. Prefer :func:`normalize_tokens` for many tokens.
+    """
+
+    return _normalize_cached(token, method)
+
+
+def normalize_tokens(tokens: Iterable[str], method: str = "stem") -> list[str]:
+    """Normalize a token list, consulting the cache once per distinct token.
+
+    Repeated tokens are resolved with a plain dict lookup instead of a cache
+    call each, which is the faster path for whole documents.
+    """
+
+    if not isinstance(tokens, list):
+        tokens = list(tokens)
+    normalized = {token: _normalize_cached(token, method) for token in dict.fromkeys(tokens)}
+    return list(map(normalized.__getitem__, tokens))
+
+
+def normalization_cache_info():
+    """Return the ``functools`` cache statistics of the normalization cache."""
+
+    return _normalize_cached.cache_info()
+
+
+def clear_normalization_cache() -> None:
+    _normalize_cached.cache_clear()
+
+
+def top_tokens(text: str, limit: int = 25, normalize: bool = False) -> list[str]:
+    """Return the most frequent tokens within the text up to limit.
+
+    With ``normalize`` set, inflections such as "developing" and "developed"
+    are counted together and reported as their most frequent surface form.
+    """
 
     tokens = tokenize_words(text)
     if not tokens:
         return []
     counter = Counter(tokens)
-    most_common = counter.most_common(limit)
-    return [token for token, _ in most_common]
+    if not normalize:
+        return [token for token, _ in counter.most_common(limit)]
+
+    groups: Counter[str] = Counter()
+    surface: dict[str, str] = {}
+    stems = normalize_tokens(counter)
+    for (token, count), stem in zip(counter.items(), stems):
+        groups[stem] += count
+        if stem not in surface or count > counter[surface[stem]]:
+            surface[stem] = token
+    return [surface[stem] for stem, _ in groups.most_common(limit)]
 
 
 __all__ = [
@@ -73,5 +167,12 @@ __all__ = [
     "extract_email",
     "extract_phone",
     "count_words",
+    "clear_normalization_cache",
+    "get_lemmatizer",
+    "get_stemmer",
+    "normalization_cache_info",
+    "normalize_token",
+    "normalize_tokens",
     "top_tokens",
+    "warm_normalizer",
 ]
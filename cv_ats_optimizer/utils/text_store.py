@@ -0,0 +1,191 @@
+"""Process-wide, content-addressed store for texts shared between sessions."""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from concurrent.futures import Future
+from dataclasses import dataclass, fields, is_dataclass
+import hashlib
+import sys
+import threading
+from typing import Any, Callable
+import weakref
+
+from cv_ats_optimizer.config.settings import settings
+
+
+def content_key(text: str) -> str:
+    """Return the content hash used to address a text."""
+
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def estimate_size(value: Any) -> int:
+    """Approximate the memory footprint of strings, containers and dataclasses."""
+
+    size = sys.getsizeof(value)
+    if isinstance(value, (list, tuple, set, frozenset)):
+        size += sum(estimate_size(item) for item in value)
+    elif isinstance(value, dict):
+        size += sum(estimate_size(k) + estimate_size(v) for k, v in value.items())
+    elif is_dataclass(value) and not isinstance(value, type):
+        size += sum(estimate_size(getattr(value, f.name)) for f in fields(value))
+    return size
+
+
+@dataclass
+class _Entry:
+    value: Any
+    size: int
+    refs: int = 0
+
+
+class TextHandle:
+    """Reference to a stored value; the value is never evicted while a handle is alive."""
+
+    __slots__ = ("key", "_store", "_finalizer", "__weakref__")
+
+    def __init__(self, store: SharedTextStore, key: str) -> None:
+        self.key = key
+        self._store = store
+        self._finalizer = weakref.finalize(self, store._decref, key)
+
+    def get(self) -> Any:
+        return self._store.get(self.key)
+
+    def release(self) -> None:
+        """Drop this handle's reference without waiting for garbage collection."""
+
+        self._finalizer()
+
+    def __repr__(self) -> str:
+        return f"TextHandle({self.key[:12]}...)"
+
+
+class SharedTextStore:
+    """Reference-counted store so sessions viewing the same document share one copy.
+
+    Values are keyed by content hash. Once the last handle to a value is
+    released or garbage collected the value becomes cold: it is kept so a
+    re-upload of the same document is free, but it is the first to go. When the
+    total estimated size exceeds ``max_bytes`` the least recently used cold
+    entries are evicted; values still referenced by a handle are never evicted,
+    so live data may hold the store above its cap.
+    """
+
+    def __init__(self, max_bytes: int) -> None:
+        self.max_bytes = max_bytes
+        self._entries: OrderedDict[str, _Entry] = OrderedDict()
+        self._total_bytes = 0
+        self._building: dict[str, Future[Any]] = {}
+        # Re-entrant because handle finalizers may run during GC while the lock is held.
+        self._lock = threading.RLock()
+
+    def put(self, text: str) -> TextHandle:
+        """Store a text and return a handle addressing it by content."""
+
+        return self.put_value(content_key(text), text)
+
+    def put_value(self, key: str, value: Any) -> TextHandle:
+        """Store an arbitrary value under a caller supplied key."""
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                entry = self._insert(key, value)
+            handle = self._new_handle(key, entry)
+            # Evict only once the new entry is referenced, so it cannot evict itself.
+            self._evict()
+            return handle
+
+    def get_or_create(self, key: str, factory: Callable[[], Any]) -> TextHandle:
+        """Return a handle for ``key``, building the value with ``factory`` if absent.
+
+        Concurrent callers for the same missing key wait for the first caller's
+        build instead of running ``factory`` themselves; if it raises, they all
+        see the same exception.
+        """
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                return self._new_handle(key, entry)
+            pending = self._building.get(key)
+            building = pending is None
+            if building:
+                pending = self._building[key] = Future()
+        if not building:
+            # put_value reuses the entry, or restores it if it was evicted meanwhile.
+            return self.put_value(key, pending.result())
+
+        try:
+            value = factory()
+        except BaseException as exc:
+            with self._lock:
+                del self._building[key]
+            pending.set_exception(exc)
+            raise
+        with self._lock:
+            handle = self.put_value(key, value)
+            del self._building[key]
+        pending.set_result(value)
+        return handle
+
+    def get(self, key: str) -> Any | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            self._entries.move_to_end(key)
+            return entry.value
+
+    @property
+    def total_bytes(self) -> int:
+        return self._total_bytes
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._entries
+
+    def _insert(self, key: str, value: Any) -> _Entry:
+        entry = _Entry(value=value, size=estimate_size(value))
+        self._entries[key] = entry
+        self._total_bytes += entry.size
+        return entry
+
+    def _new_handle(self, key: str, entry: _Entry) -> TextHandle:
+        entry.refs += 1
+        self._entries.move_to_end(key)
+        return TextHandle(self, key)
+
+    def _decref(self, key: str) -> None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return
+            entry.refs -= 1
+            self._evict()
+
+    def _evict(self) -> None:
+        if self._total_bytes <= self.max_bytes:
+            return
+        cold_keys = [key for key, entry in self._entries.items() if entry.refs <= 0]
+        for key in cold_keys:
+            if self._total_bytes <= self.max_bytes:
+                break
+            entry = self._entries.pop(key, None)
+            if entry is not None:
+                self._total_bytes -= entry.size
+
+
+text_store = SharedTextStore(settings.text_store_max_mb * 1024 * 1024)
+
+__all__ = [
+    "SharedTextStore",
+    "TextHandle",
+    "content_key",
+    "estimate_size",
+    "text_store",
+]